@@ -39,5 +39,17 @@ class Config:
     # Minimum TVL to include a pool
     MIN_TVL = 10_000
 
+    # Local write spool for when storage sinks are down or slow
+    SPOOL_DIR = os.getenv("SPOOL_DIR", ".spool")
+    SPOOL_SEGMENT_BYTES = 16 * 1024 * 1024  # 16 MB
+    SPOOL_MAX_BYTES = 1024 * 1024 * 1024  # 1 GB per sink
+    SPOOL_REPLAY_INTERVAL = 30  # seconds
+    SPOOL_REPLAY_BATCH = 5_000  # records
+    SPOOL_MAX_REPLAY_ATTEMPTS = 5  # rejections before a batch is dropped
+    SINK_LATENCY_BUDGET = 10.0  # seconds per write before spooling
+
+    # Columnar archive of each indexing cycle (disabled if empty)
+    ARCHIVE_DIR = os.getenv("ARCHIVE_DIR", "")
+
 
 config = Config()
@@ -1,11 +1,16 @@
 import asyncio
 import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
 from .config import config
 from .fetchers import DeFiLlamaFetcher
-from .processors import PoolNormalizer, RiskCalculator
+from .models import Pool, RawPool, RiskAssessment
+from .processors import PoolProcessor
+from .storage import CycleArchive, PoolSink, SpooledSink, WriteSpool, pool_to_record
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -14,10 +19,23 @@ logger = logging.getLogger(__name__)
 class Indexer:
     """Main indexer that orchestrates data fetching and processing"""
 
-    def __init__(self):
+    def __init__(self, sinks: Optional[list[PoolSink]] = None):
         self.scheduler = AsyncIOScheduler()
-        self.normalizer = PoolNormalizer()
-        self.risk_calculator = RiskCalculator()
+        self.processor = PoolProcessor()
+        self.sinks = [
+            SpooledSink(
+                sink,
+                WriteSpool(
+                    Path(config.SPOOL_DIR) / sink.name,
+                    segment_bytes=config.SPOOL_SEGMENT_BYTES,
+                    max_bytes=config.SPOOL_MAX_BYTES,
+                ),
+                latency_budget=config.SINK_LATENCY_BUDGET,
+                max_replay_attempts=config.SPOOL_MAX_REPLAY_ATTEMPTS,
+            )
+            for sink in sinks or []
+        ]
+        self.archive = CycleArchive(Path(config.ARCHIVE_DIR)) if config.ARCHIVE_DIR else None
 
     def start(self):
         """Start the indexer scheduler"""
@@ -29,6 +47,15 @@ class Indexer:
             replace_existing=True,
         )
 
+        # Drain spooled writes once sinks recover
+        if self.sinks:
+            self.scheduler.add_job(
+                self.replay_spools,
+                IntervalTrigger(seconds=config.SPOOL_REPLAY_INTERVAL),
+                id="replay_spools",
+                replace_existing=True,
+            )
+
         # Run initial indexing
         self.scheduler.add_job(
             self.index_pools,
@@ -49,36 +76,69 @@ class Indexer:
 
             logger.info(f"Fetched {len(raw_pools)} pools from DeFiLlama")
 
-            processed = 0
-            for raw_pool in raw_pools:
-                try:
-                    # Normalize pool data
-                    pool = self.normalizer.normalize(raw_pool)
-
-                    # Calculate risk score
-                    risk = self.risk_calculator.calculate_risk(
-                        protocol=pool.protocol,
-                        tvl=pool.tvl,
-                        tokens=pool.tokens,
-                        is_audited=pool.is_audited,
-                        pool_age_days=pool.age_days,
-                        reward_token=pool.reward_token,
-                    )
-
-                    pool.risk_score = risk.score
-                    pool.il_risk = risk.il_risk
-
-                    # TODO: Store in database
-                    processed += 1
-
-                except Exception as e:
-                    logger.error(f"Error processing pool {raw_pool.pool_id}: {e}")
-
-            logger.info(f"Processed {processed} pools successfully")
+            await self.process_cycle(raw_pools, datetime.utcnow())
 
         except Exception as e:
             logger.error(f"Pool indexing failed: {e}")
 
+    async def process_cycle(self, raw_pools: list[RawPool], cycle_at: datetime) -> None:
+        """Process one cycle of fetched pools, archive it and store it"""
+        scored = {}
+        for raw_pool in raw_pools:
+            try:
+                scored[raw_pool.pool_id] = self.processor.process(raw_pool)
+            except Exception as e:
+                logger.error(f"Error processing pool {raw_pool.pool_id}: {e}")
+
+        pools = [pool for pool, _ in scored.values()]
+        logger.info(f"Processed {len(pools)} pools successfully")
+
+        # Archive first so the cycle is kept even if storage fails
+        if self.archive:
+            await self.archive_cycle(self.archive, raw_pools, scored, cycle_at)
+
+        # TODO: Store in database (no Postgres/Redis PoolSink exists yet,
+        # so main() runs without sinks and this writes nowhere)
+        await self.store_pools(pools)
+
+    async def store_pools(self, pools: list[Pool]) -> None:
+        """Write pools to every sink, spooling locally on failure"""
+        records = [pool_to_record(pool) for pool in pools]
+        results = await asyncio.gather(
+            *(sink.write(records) for sink in self.sinks), return_exceptions=True
+        )
+        for sink, result in zip(self.sinks, results):
+            if isinstance(result, Exception):
+                logger.error(f"Storing pools to {sink.name} failed: {result}")
+
+    async def archive_cycle(
+        self,
+        archive: CycleArchive,
+        raw_pools: list[RawPool],
+        scored: dict[str, tuple[Pool, RiskAssessment]],
+        cycle_at: datetime,
+    ) -> None:
+        """Write the cycle to the columnar archive without blocking the loop"""
+        try:
+            path = await asyncio.to_thread(archive.write_cycle, raw_pools, scored, cycle_at)
+            logger.info(f"Archived cycle to {path}")
+        except Exception as e:
+            logger.error(f"Cycle archive failed: {e}")
+
+    async def replay_spools(self) -> None:
+        """Drain spooled records into sinks that have recovered"""
+        for sink in self.sinks:
+            try:
+                await sink.replay(config.SPOOL_REPLAY_BATCH)
+            except Exception as e:
+                logger.error(f"Spool replay for {sink.name} failed: {e}")
+
+            metrics = await sink.metrics()
+            if metrics["spool_lag_bytes"] or metrics["spool_dropped_bytes"]:
+                logger.info(f"Spool metrics for {sink.name}: {metrics}")
+            else:
+                logger.debug(f"Spool metrics for {sink.name}: {metrics}")
+
 
 async def main():
     """Main entry point"""
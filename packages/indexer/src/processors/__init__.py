@@ -1,4 +1,5 @@
 from .risk_calculator import RiskCalculator
 from .normalizer import PoolNormalizer
+from .pipeline import PoolProcessor
 
-__all__ = ["RiskCalculator", "PoolNormalizer"]
+__all__ = ["RiskCalculator", "PoolNormalizer", "PoolProcessor"]
@@ -0,0 +1,28 @@
+from ..models import Pool, RawPool, RiskAssessment
+from .normalizer import PoolNormalizer
+from .risk_calculator import RiskCalculator
+
+
+class PoolProcessor:
+    """Normalize raw pools and score their risk"""
+
+    def __init__(self) -> None:
+        self.normalizer = PoolNormalizer()
+        self.risk_calculator = RiskCalculator()
+
+    def process(self, raw_pool: RawPool) -> tuple[Pool, RiskAssessment]:
+        """Normalize a raw pool and calculate its risk score."""
+        pool = self.normalizer.normalize(raw_pool)
+
+        risk = self.risk_calculator.calculate_risk(
+            protocol=pool.protocol,
+            tvl=pool.tvl,
+            tokens=pool.tokens,
+            is_audited=pool.is_audited,
+            pool_age_days=pool.age_days,
+            reward_token=pool.reward_token,
+        )
+
+        pool.risk_score = risk.score
+        pool.il_risk = risk.il_risk
+        return pool, risk
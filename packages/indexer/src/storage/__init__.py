@@ -0,0 +1,6 @@
+from .spool import WriteSpool
+from .sink import PoolSink, SpooledSink
+from .records import pool_to_record
+from .archive import CycleArchive
+
+__all__ = ["WriteSpool", "PoolSink", "SpooledSink", "pool_to_record", "CycleArchive"]
@@ -0,0 +1,145 @@
+import os
+from dataclasses import fields
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from ..models import Pool, RawPool, RiskAssessment
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.fs as pafs
+    import pyarrow.parquet as pq
+except ImportError:  # optional "archive" extra
+    pa = None
+
+# RawPool fields, stored as-is so archived cycles can be re-processed
+RAW_POOL_COLUMNS = [f.name for f in fields(RawPool)]
+
+# Low-cardinality string columns stored dictionary-encoded
+DICTIONARY_COLUMNS = ["chain", "project", "symbol", "protocol", "pool_type", "il_risk"]
+
+
+def _schema() -> "pa.Schema":
+    category = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema(
+        [
+            # Cycle
+            ("cycle_at", pa.timestamp("us")),
+            # RawPool, as fetched
+            ("chain", category),
+            ("project", category),
+            ("symbol", category),
+            ("tvl_usd", pa.float64()),
+            ("apy", pa.float64()),
+            ("apy_base", pa.float64()),
+            ("apy_reward", pa.float64()),
+            ("pool_id", pa.string()),
+            ("reward_tokens", pa.list_(pa.string())),
+            ("underlying_tokens", pa.list_(pa.string())),
+            ("stablecoin", pa.bool_()),
+            # Pool / RiskAssessment, null if processing failed
+            ("protocol", category),
+            ("pool_type", category),
+            ("il_risk", category),
+            ("risk_score", pa.int32()),
+            ("risk_smart_contract", pa.int32()),
+            ("risk_impermanent_loss", pa.int32()),
+            ("risk_protocol", pa.int32()),
+            ("risk_liquidity", pa.int32()),
+            ("risk_reward_token", pa.int32()),
+        ]
+    )
+
+
+class CycleArchive:
+    """Columnar Parquet archive of indexing cycles, partitioned by date.
+
+    Each cycle is one zstd-compressed file under `date=YYYY-MM-DD/`, with
+    one row per raw pool alongside the pool and risk data derived from it.
+    """
+
+    def __init__(self, root: Path):
+        if pa is None:
+            raise RuntimeError(
+                "pyarrow is required for cycle archives: "
+                "pip install 'vibe-defi-indexer[archive]'"
+            )
+        self.root = Path(root)
+        self.schema = _schema()
+
+    def write_cycle(
+        self,
+        raw_pools: list[RawPool],
+        scored: dict[str, tuple[Pool, RiskAssessment]],
+        cycle_at: datetime,
+    ) -> Path:
+        """Write one cycle. `scored` maps raw pool_id to its processed result."""
+        results = [scored.get(raw.pool_id) for raw in raw_pools]
+        pools = [r[0] if r else None for r in results]
+        risks = [r[1] if r else None for r in results]
+
+        def raw_column(name: str) -> list[Any]:
+            return [getattr(raw, name) for raw in raw_pools]
+
+        def factor_column(name: str) -> list[Optional[int]]:
+            return [getattr(r.factors, name) if r else None for r in risks]
+
+        columns = {
+            "cycle_at": [cycle_at] * len(raw_pools),
+            **{name: raw_column(name) for name in RAW_POOL_COLUMNS},
+            "protocol": [p.protocol if p else None for p in pools],
+            "pool_type": [p.pool_type if p else None for p in pools],
+            "il_risk": [r.il_risk.value if r else None for r in risks],
+            "risk_score": [r.score if r else None for r in risks],
+            "risk_smart_contract": factor_column("smart_contract"),
+            "risk_impermanent_loss": factor_column("impermanent_loss"),
+            "risk_protocol": factor_column("protocol"),
+            "risk_liquidity": factor_column("liquidity"),
+            "risk_reward_token": factor_column("reward_token"),
+        }
+        table = pa.Table.from_pydict(columns, schema=self.schema)
+
+        partition = self.root / f"date={cycle_at.date().isoformat()}"
+        partition.mkdir(parents=True, exist_ok=True)
+        path = partition / f"{cycle_at:%H%M%S%f}.parquet"
+
+        # Write under a hidden name so readers never see a partial file
+        tmp = partition / f".{path.name}.tmp"
+        pq.write_table(
+            table,
+            tmp,
+            compression="zstd",
+            use_dictionary=DICTIONARY_COLUMNS,
+        )
+        os.replace(tmp, path)
+        return path
+
+    def dataset(self, start: date, end: date) -> tuple["ds.Dataset", "ds.Expression"]:
+        """Memory-mapped dataset over the archive, and a filter for [start, end]."""
+        dataset = ds.dataset(
+            str(self.root),
+            format="parquet",
+            filesystem=pafs.LocalFileSystem(use_mmap=True),
+            schema=self.schema.append(pa.field("date", pa.string())),
+            partitioning=ds.partitioning(pa.schema([("date", pa.string())]), flavor="hive"),
+        )
+        condition = (ds.field("date") >= start.isoformat()) & (ds.field("date") <= end.isoformat())
+        return dataset, condition
+
+    def read(self, start: date, end: date, columns: Optional[list[str]] = None) -> "pa.Table":
+        """Read archived cycles between two dates (inclusive) into one table."""
+        dataset, condition = self.dataset(start, end)
+        return dataset.to_table(columns=columns, filter=condition)
+
+    def iter_batches(
+        self,
+        start: date,
+        end: date,
+        columns: Optional[list[str]] = None,
+        batch_size: int = 65_536,
+    ) -> Iterator["pa.RecordBatch"]:
+        """Stream archived cycles between two dates as record batches."""
+        dataset, condition = self.dataset(start, end)
+        yield from dataset.to_batches(columns=columns, filter=condition, batch_size=batch_size)
@@ -0,0 +1,12 @@
+from dataclasses import asdict
+from typing import Any
+
+from ..models import Pool
+
+
+def pool_to_record(pool: Pool) -> dict[str, Any]:
+    """Convert a pool into a JSON-serializable record for storage."""
+    record = asdict(pool)
+    record["il_risk"] = pool.il_risk.value
+    record["updated_at"] = pool.updated_at.isoformat()
+    return record
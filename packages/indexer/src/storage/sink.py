@@ -0,0 +1,134 @@
+import asyncio
+import logging
+from typing import Any, Callable, Optional, Protocol, TypeVar
+
+from .spool import WriteSpool
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class PoolSink(Protocol):
+    """Destination for pool records (e.g. Postgres, Redis).
+
+    Writes may be replayed after a failure, so `write` must be an
+    idempotent upsert keyed on the record's `id`. Raise `OSError` (e.g.
+    `ConnectionError`) when the sink is unavailable; any other exception
+    is treated as the sink rejecting the records.
+    """
+
+    name: str
+
+    async def write(self, records: list[dict[str, Any]]) -> None: ...
+
+
+class SpooledSink:
+    """Wrap a sink so failed or slow writes go to a local spool.
+
+    While the spool holds a backlog, new writes are appended behind it
+    rather than sent directly, so records for a pool always reach the
+    sink in the order they were produced.
+    """
+
+    def __init__(
+        self,
+        sink: PoolSink,
+        spool: WriteSpool,
+        latency_budget: float,
+        max_replay_attempts: int,
+    ):
+        self.sink = sink
+        self.spool = spool
+        self.latency_budget = latency_budget
+        self.max_replay_attempts = max_replay_attempts
+        self._spool_lock = asyncio.Lock()
+        # Consecutive rejections of the batch starting at this cursor
+        self._rejected_at: Optional[tuple[int, int]] = None
+        self._rejections = 0
+
+    @property
+    def name(self) -> str:
+        return self.sink.name
+
+    async def write(self, records: list[dict[str, Any]]) -> None:
+        """Write to the sink, falling back to the spool."""
+        if not await self._run(self.spool.is_empty):
+            await self._run(self.spool.append, records)
+            return
+
+        try:
+            await asyncio.wait_for(self.sink.write(records), timeout=self.latency_budget)
+        except Exception as e:
+            logger.warning(f"Sink {self.name} unavailable ({e!r}), spooling {len(records)} records")
+            await self._run(self.spool.append, records)
+
+    async def replay(self, batch_size: int) -> int:
+        """Drain the spool into the sink in batches. Returns records replayed."""
+        replayed = 0
+
+        while True:
+            start = self.spool.cursor
+            records, position = await self._run(self.spool.read_batch, batch_size)
+            if not records and position == start:
+                break
+
+            if records:
+                try:
+                    await asyncio.wait_for(self.sink.write(records), timeout=self.latency_budget)
+                except (OSError, asyncio.TimeoutError) as e:
+                    logger.warning(f"Replay to {self.name} failed ({e!r}), will retry")
+                    break
+                except Exception as e:
+                    if not await self._reject(start, position, len(records), e):
+                        break
+                    continue
+
+            self._rejected_at, self._rejections = None, 0
+            await self._run(self.spool.commit, position)
+            replayed += len(records)
+            if len(records) < batch_size:
+                break
+
+        if replayed:
+            logger.info(f"Replayed {replayed} spooled records to {self.name}")
+        return replayed
+
+    async def _reject(
+        self, start: tuple[int, int], position: tuple[int, int], count: int, error: Exception
+    ) -> bool:
+        """Count a rejected batch, dropping it once it has been rejected too often.
+
+        Returns whether the batch was dropped and replay can move on.
+        """
+        if self._rejected_at != start:
+            self._rejected_at, self._rejections = start, 0
+        self._rejections += 1
+
+        if self._rejections < self.max_replay_attempts:
+            logger.warning(
+                f"Sink {self.name} rejected replayed batch ({error!r}), "
+                f"attempt {self._rejections}/{self.max_replay_attempts}"
+            )
+            return False
+
+        dropped = await self._run(self.spool.skip, position)
+        logger.error(
+            f"Sink {self.name} rejected replayed batch {self._rejections} times ({error!r}), "
+            f"dropped {count} records ({dropped} bytes)"
+        )
+        self._rejected_at, self._rejections = None, 0
+        return True
+
+    async def metrics(self) -> dict[str, float]:
+        """Spool lag for this sink, and bytes dropped over its lifetime."""
+        return {
+            "spool_lag_bytes": await self._run(self.spool.lag_bytes),
+            "spool_lag_seconds": await self._run(self.spool.lag_seconds),
+            "spool_dropped_bytes": self.spool.dropped_bytes,
+        }
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking spool call in a worker thread, one at a time."""
+        async with self._spool_lock:
+            return await asyncio.to_thread(func, *args)
@@ -0,0 +1,224 @@
+import json
+import logging
+import os
+import struct
+import time
+import zlib
+from pathlib import Path
+from typing import Any, BinaryIO
+
+logger = logging.getLogger(__name__)
+
+# Record header: payload length + CRC32 of payload (big-endian)
+_HEADER = struct.Struct(">II")
+_SEGMENT_SUFFIX = ".seg"
+_CURSOR_FILE = "cursor"
+
+
+class WriteSpool:
+    """Append-only, segment-rotated local spool of JSON records.
+
+    Records are length-prefixed and checksummed, appended in order and
+    fsynced once per `append` call. A persisted cursor marks how far the
+    replayer has drained; fully drained segments are deleted. When the
+    spool grows past `max_bytes` the oldest segments are dropped. Bytes
+    dropped either way are counted in `dropped_bytes`, which is persisted
+    with the cursor.
+    """
+
+    def __init__(self, directory: Path, segment_bytes: int, max_bytes: int):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self.max_bytes = max_bytes
+
+        # Never append to a segment left by a previous process: it may end
+        # in a torn record. Start a fresh one instead.
+        existing = self._segment_ids()
+        self._active_id = existing[-1] + 1 if existing else 0
+        self._active: BinaryIO = open(self._segment_path(self._active_id), "ab")
+        self._active_size = 0
+
+        self._cursor, self.dropped_bytes = self._load_cursor(existing)
+
+    def append(self, records: list[dict[str, Any]]) -> None:
+        """Append records and fsync them as a single batch."""
+        if not records:
+            return
+
+        now = time.time()
+        for record in records:
+            payload = json.dumps({"ts": now, "data": record}, separators=(",", ":")).encode()
+            self._active.write(_HEADER.pack(len(payload), zlib.crc32(payload)))
+            self._active.write(payload)
+            self._active_size += _HEADER.size + len(payload)
+
+            if self._active_size >= self.segment_bytes:
+                self._rotate()
+
+        self._sync()
+        self._enforce_limit()
+
+    def read_batch(self, max_records: int) -> tuple[list[dict[str, Any]], tuple[int, int]]:
+        """Read up to `max_records` records from the cursor.
+
+        Returns the records and the position to pass to `commit` once they
+        have been written to the sink.
+        """
+        segment_id, offset = self._cursor
+        records: list[dict[str, Any]] = []
+
+        while len(records) < max_records and segment_id <= self._active_id:
+            path = self._segment_path(segment_id)
+            if not path.exists():
+                segment_id, offset = segment_id + 1, 0
+                continue
+
+            with open(path, "rb") as f:
+                f.seek(offset)
+                while len(records) < max_records:
+                    header = f.read(_HEADER.size)
+                    if len(header) < _HEADER.size:
+                        break
+                    length, checksum = _HEADER.unpack(header)
+                    payload = f.read(length)
+                    if len(payload) < length or zlib.crc32(payload) != checksum:
+                        logger.warning(
+                            f"Spool {self.directory}: corrupt record in segment "
+                            f"{segment_id} at offset {offset}, skipping rest of segment"
+                        )
+                        offset = path.stat().st_size
+                        break
+                    records.append(json.loads(payload)["data"])
+                    offset += _HEADER.size + length
+
+            if len(records) >= max_records or segment_id == self._active_id:
+                break
+            segment_id, offset = segment_id + 1, 0
+
+        return records, (segment_id, offset)
+
+    @property
+    def cursor(self) -> tuple[int, int]:
+        """Position of the first record not yet committed."""
+        return self._cursor
+
+    def commit(self, position: tuple[int, int]) -> None:
+        """Persist the replay cursor and delete fully drained segments."""
+        self._cursor = position
+        self._write_cursor()
+
+        for segment_id in self._segment_ids():
+            if segment_id < position[0]:
+                self._segment_path(segment_id).unlink(missing_ok=True)
+
+    def skip(self, position: tuple[int, int]) -> int:
+        """Commit past records without delivering them. Returns bytes dropped."""
+        before = self.lag_bytes()
+        self._cursor = position
+        dropped = before - self.lag_bytes()
+        self.dropped_bytes += dropped
+        self.commit(position)
+        return dropped
+
+    def is_empty(self) -> bool:
+        """Whether every appended record has been committed."""
+        return self.lag_bytes() == 0
+
+    def lag_bytes(self) -> int:
+        """Bytes appended but not yet committed."""
+        segment_id, offset = self._cursor
+        total = 0
+        for sid in self._segment_ids():
+            if sid > segment_id:
+                total += self._segment_path(sid).stat().st_size
+            elif sid == segment_id:
+                total += max(0, self._segment_path(sid).stat().st_size - offset)
+        return total
+
+    def lag_seconds(self) -> float:
+        """Age of the oldest uncommitted record, 0 if the spool is empty."""
+        if self.is_empty():
+            return 0.0
+        segment_id, offset = self._cursor
+        for sid in self._segment_ids():
+            if sid < segment_id:
+                continue
+            with open(self._segment_path(sid), "rb") as f:
+                f.seek(offset if sid == segment_id else 0)
+                header = f.read(_HEADER.size)
+                if len(header) < _HEADER.size:
+                    continue
+                length, _ = _HEADER.unpack(header)
+                try:
+                    written_at = float(json.loads(f.read(length))["ts"])
+                except ValueError:
+                    continue
+                return max(0.0, time.time() - written_at)
+        return 0.0
+
+    def close(self) -> None:
+        self._sync()
+        self._active.close()
+
+    def _rotate(self) -> None:
+        self._sync()
+        self._active.close()
+        self._active_id += 1
+        self._active = open(self._segment_path(self._active_id), "ab")
+        self._active_size = 0
+
+    def _sync(self) -> None:
+        self._active.flush()
+        os.fsync(self._active.fileno())
+
+    def _enforce_limit(self) -> None:
+        """Drop the oldest segments until the spool fits in `max_bytes`."""
+        segments = [(sid, self._segment_path(sid).stat().st_size) for sid in self._segment_ids()]
+        total = sum(size for _, size in segments)
+
+        for segment_id, size in segments:
+            if total <= self.max_bytes or segment_id == self._active_id:
+                break
+            self._segment_path(segment_id).unlink(missing_ok=True)
+            total -= size
+            self.dropped_bytes += size
+            logger.error(
+                f"Spool {self.directory} over {self.max_bytes} bytes, "
+                f"dropped segment {segment_id} ({size} bytes)"
+            )
+            if self._cursor[0] <= segment_id:
+                self._cursor = (segment_id + 1, 0)
+            self._write_cursor()
+
+    def _write_cursor(self) -> None:
+        """Atomically persist the cursor and the dropped-bytes counter."""
+        tmp = self.directory / f"{_CURSOR_FILE}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(
+                {
+                    "segment": self._cursor[0],
+                    "offset": self._cursor[1],
+                    "dropped_bytes": self.dropped_bytes,
+                },
+                f,
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.directory / _CURSOR_FILE)
+
+    def _load_cursor(self, existing: list[int]) -> tuple[tuple[int, int], int]:
+        path = self.directory / _CURSOR_FILE
+        if path.exists():
+            try:
+                data = json.loads(path.read_text())
+                return (data["segment"], data["offset"]), data.get("dropped_bytes", 0)
+            except (ValueError, KeyError) as e:
+                logger.warning(f"Spool {self.directory}: unreadable cursor ({e}), replaying all")
+        return ((existing[0] if existing else self._active_id), 0), 0
+
+    def _segment_ids(self) -> list[int]:
+        return sorted(int(p.stem) for p in self.directory.glob(f"*{_SEGMENT_SUFFIX}"))
+
+    def _segment_path(self, segment_id: int) -> Path:
+        return self.directory / f"{segment_id:020d}{_SEGMENT_SUFFIX}"
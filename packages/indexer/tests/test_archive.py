@@ -0,0 +1,77 @@
+from datetime import date, datetime
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from src.models import RawPool
+from src.processors import PoolProcessor
+from src.replay import replay
+from src.storage import CycleArchive
+
+
+def raw_pool(i):
+    return RawPool(
+        chain="ethereum",
+        project="uniswap-v3",
+        symbol="WETH-USDC",
+        tvl_usd=1_000_000.0 + i,
+        apy=5.0,
+        apy_base=3.0,
+        apy_reward=2.0,
+        pool_id=f"pool-{i}",
+        reward_tokens=["UNI"],
+        underlying_tokens=[],
+        stablecoin=False,
+    )
+
+
+def test_round_trip_and_replay(tmp_path):
+    raw_pools = [raw_pool(i) for i in range(10)]
+    processor = PoolProcessor()
+    scored = {raw.pool_id: processor.process(raw) for raw in raw_pools[:-1]}
+
+    archive = CycleArchive(tmp_path)
+    archive.write_cycle(raw_pools, scored, datetime(2026, 1, 1, 12))
+    archive.write_cycle(raw_pools, scored, datetime(2026, 1, 3, 12))
+
+    table = archive.read(date(2026, 1, 1), date(2026, 1, 2))
+    assert table.num_rows == 10
+    assert table.column("risk_score").null_count == 1
+
+    stats = replay(archive, date(2026, 1, 1), date(2026, 1, 3))
+    assert stats.rows == 20
+    assert stats.failed == 0
+    assert stats.changed == 0
+    assert stats.newly_scored == 2
+
+
+def test_mean_abs_delta_is_over_changed_rows(tmp_path, monkeypatch):
+    raw_pools = [raw_pool(i) for i in range(4)]
+    processor = PoolProcessor()
+    scored = {raw.pool_id: processor.process(raw) for raw in raw_pools}
+
+    archive = CycleArchive(tmp_path)
+    archive.write_cycle(raw_pools, scored, datetime(2026, 1, 1, 12))
+
+    # Simulate a weight change that only affects one pool
+    original = PoolProcessor.process
+
+    def reweighted(self, raw):
+        pool, risk = original(self, raw)
+        if raw.pool_id == "pool-0":
+            risk.score += 6
+        return pool, risk
+
+    monkeypatch.setattr(PoolProcessor, "process", reweighted)
+    stats = replay(archive, date(2026, 1, 1), date(2026, 1, 1))
+
+    assert stats.changed == 1
+    assert stats.mean_abs_delta == 6
+
+
+def test_empty_range_returns_no_rows(tmp_path):
+    archive = CycleArchive(tmp_path)
+
+    assert archive.read(date(2026, 1, 1), date(2026, 1, 2)).num_rows == 0
+    assert replay(archive, date(2026, 1, 1), date(2026, 1, 2)).rows == 0
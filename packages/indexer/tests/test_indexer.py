@@ -0,0 +1,77 @@
+from datetime import datetime
+
+import pytest
+
+from src.config import config
+from src.main import Indexer
+from src.models import RawPool
+
+
+def raw_pool(i):
+    return RawPool(
+        chain="ethereum",
+        project="aave-v3",
+        symbol="USDC",
+        tvl_usd=1_000_000.0,
+        apy=4.0,
+        apy_base=4.0,
+        apy_reward=0.0,
+        pool_id=f"pool-{i}",
+        reward_tokens=[],
+        underlying_tokens=[],
+        stablecoin=True,
+    )
+
+
+class DownSink:
+    name = "down"
+
+    async def write(self, records):
+        raise ConnectionError("sink down")
+
+
+class UpSink:
+    name = "up"
+
+    def __init__(self):
+        self.received = []
+
+    async def write(self, records):
+        self.received.extend(records)
+
+
+@pytest.fixture
+def spool_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "SPOOL_DIR", str(tmp_path / "spool"))
+    monkeypatch.setattr(config, "ARCHIVE_DIR", "")
+
+
+async def test_spool_failure_does_not_abort_other_sinks(spool_dir):
+    up = UpSink()
+    indexer = Indexer(sinks=[DownSink(), up])
+
+    def disk_full(records):
+        raise OSError(28, "No space left on device")
+
+    indexer.sinks[0].spool.append = disk_full
+
+    pool, _ = indexer.processor.process(raw_pool(0))
+    await indexer.store_pools([pool])
+
+    assert [r["id"] for r in up.received] == [pool.id]
+
+
+async def test_cycle_is_archived_when_storage_fails(tmp_path, spool_dir, monkeypatch):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setattr(config, "ARCHIVE_DIR", str(tmp_path / "archive"))
+    indexer = Indexer()
+
+    async def storage_down(pools):
+        raise RuntimeError("storage down")
+
+    indexer.store_pools = storage_down
+
+    with pytest.raises(RuntimeError):
+        await indexer.process_cycle([raw_pool(0), raw_pool(1)], datetime(2026, 1, 1, 12))
+
+    assert len(list((tmp_path / "archive").glob("date=2026-01-01/*.parquet"))) == 1
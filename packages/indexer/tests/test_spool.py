@@ -0,0 +1,175 @@
+import asyncio
+import json
+
+from src.storage import SpooledSink, WriteSpool
+
+
+def make_spool(tmp_path, segment_bytes=200, max_bytes=100_000):
+    return WriteSpool(tmp_path / "spool", segment_bytes=segment_bytes, max_bytes=max_bytes)
+
+
+def records(start, stop):
+    return [{"id": i} for i in range(start, stop)]
+
+
+def drain(spool, batch_size=1_000):
+    replayed = []
+    while True:
+        batch, position = spool.read_batch(batch_size)
+        spool.commit(position)
+        replayed.extend(batch)
+        if len(batch) < batch_size:
+            return replayed
+
+
+class FakeSink:
+    name = "fake"
+
+    def __init__(self):
+        self.up = True
+        self.rejected_ids = set()
+        self.writes = 0
+        self.received = []
+        self.started = asyncio.Event()
+        self.release = None
+
+    async def write(self, records):
+        self.writes += 1
+        if not self.up:
+            raise ConnectionError("sink down")
+        if any(r["id"] in self.rejected_ids for r in records):
+            raise ValueError("constraint violation")
+        self.started.set()
+        if self.release is not None:
+            await self.release.wait()
+        self.received.extend(records)
+
+
+def test_rotation_then_restart(tmp_path):
+    spool = make_spool(tmp_path)
+    spool.append(records(0, 20))
+    spool.close()
+    assert len(list((tmp_path / "spool").glob("*.seg"))) > 2
+
+    spool = make_spool(tmp_path)
+    spool.append(records(20, 25))
+
+    assert drain(spool) == records(0, 25)
+    assert spool.is_empty()
+
+
+def test_truncated_last_record_is_skipped(tmp_path):
+    spool = make_spool(tmp_path, segment_bytes=10_000)
+    spool.append(records(0, 5))
+    spool.close()
+
+    segment = next((tmp_path / "spool").glob("*.seg"))
+    segment.write_bytes(segment.read_bytes()[:-3])
+
+    spool = make_spool(tmp_path, segment_bytes=10_000)
+    spool.append(records(5, 7))
+
+    assert drain(spool) == records(0, 4) + records(5, 7)
+    assert spool.is_empty()
+
+
+def test_cursor_survives_restart(tmp_path):
+    spool = make_spool(tmp_path)
+    spool.append(records(0, 10))
+    batch, position = spool.read_batch(4)
+    spool.commit(position)
+    assert batch == records(0, 4)
+    spool.close()
+
+    spool = make_spool(tmp_path)
+    assert not spool.is_empty()
+    assert drain(spool) == records(4, 10)
+
+
+def test_enforce_limit_moves_cursor_forward(tmp_path):
+    spool = make_spool(tmp_path, segment_bytes=200, max_bytes=500)
+    spool.append(records(0, 30))
+
+    assert spool.dropped_bytes > 0
+    cursor = json.loads((tmp_path / "spool" / "cursor").read_text())
+    assert cursor["segment"] > 0
+    assert cursor["offset"] == 0
+    assert cursor["dropped_bytes"] == spool.dropped_bytes
+
+    remaining = drain(spool)
+    assert remaining == records(30 - len(remaining), 30)
+    assert spool.lag_bytes() == 0
+
+    dropped = spool.dropped_bytes
+    spool.close()
+    assert make_spool(tmp_path, max_bytes=500).dropped_bytes == dropped
+
+
+async def test_write_during_replay_lands_after_backlog(tmp_path):
+    sink = FakeSink()
+    spooled = SpooledSink(sink, make_spool(tmp_path), latency_budget=5.0, max_replay_attempts=3)
+
+    sink.up = False
+    await spooled.write(records(0, 5))
+    assert not spooled.spool.is_empty()
+
+    sink.up = True
+    sink.started.clear()
+    sink.release = asyncio.Event()
+    replay = asyncio.create_task(spooled.replay(batch_size=100))
+    await sink.started.wait()
+
+    # The backlog is still in flight, so this must queue behind it
+    await spooled.write(records(5, 8))
+    sink.release.set()
+    await replay
+    await spooled.replay(batch_size=100)
+
+    assert sink.received == records(0, 8)
+    assert spooled.spool.is_empty()
+
+
+async def test_rejected_batch_is_dropped_after_max_attempts(tmp_path):
+    sink = FakeSink()
+    spooled = SpooledSink(sink, make_spool(tmp_path), latency_budget=5.0, max_replay_attempts=3)
+
+    sink.rejected_ids = {"bad"}
+    await spooled.write([{"id": "bad"}])
+    await spooled.write(records(0, 3))
+    assert sink.received == []
+
+    for _ in range(2):
+        assert await spooled.replay(batch_size=1) == 0
+    assert spooled.spool.dropped_bytes == 0
+
+    # Third rejection drops the batch and the backlog behind it drains
+    assert await spooled.replay(batch_size=1) == 3
+    assert sink.received == records(0, 3)
+    assert spooled.spool.dropped_bytes > 0
+    assert spooled.spool.is_empty()
+
+    await spooled.write(records(3, 5))
+    assert sink.received == records(0, 5)
+
+
+async def test_unavailable_sink_is_retried_without_dropping(tmp_path):
+    sink = FakeSink()
+    spooled = SpooledSink(sink, make_spool(tmp_path), latency_budget=5.0, max_replay_attempts=2)
+
+    sink.up = False
+    await spooled.write(records(0, 3))
+    for _ in range(5):
+        assert await spooled.replay(batch_size=100) == 0
+
+    sink.up = True
+    assert await spooled.replay(batch_size=100) == 3
+    assert spooled.spool.dropped_bytes == 0
+
+
+async def test_idle_replay_does_not_touch_cursor(tmp_path):
+    sink = FakeSink()
+    spooled = SpooledSink(sink, make_spool(tmp_path), latency_budget=5.0, max_replay_attempts=3)
+
+    assert await spooled.replay(batch_size=100) == 0
+    assert not (tmp_path / "spool" / "cursor").exists()
+    assert sink.writes == 0